@@ -0,0 +1,79 @@
+"""Startup benchmark for the setDressTools package.
+
+Run with hython:
+    hython houdini/scripts/benchmark_startup.py [node_count]
+
+The node creation is measured twice: once with the parm template group
+cleared before every node (baseline, the interface is rebuilt per node)
+and once with the cache enabled.
+"""
+import os
+import subprocess
+import sys
+import time
+
+import hou
+
+from setDressTools.importSetDress import ImportSetDress
+
+node_type_name = "P3D.setDress::ImportSetDress"
+
+def benchmark_import():
+    """Time the package import and the first class access in a fresh interpreter.
+
+    Returns:
+        tuple(float,float): Package import time and class access time in seconds.
+    """
+    script = (
+        "import time;"
+        "start = time.perf_counter();"
+        "import setDressTools;"
+        "middle = time.perf_counter();"
+        "setDressTools.ImportSetDress;"
+        "end = time.perf_counter();"
+        "print(middle - start, end - middle)"
+    )
+
+    output = subprocess.check_output([sys.executable, "-c", script], env=os.environ)
+    package_time, access_time = output.decode().split()[-2:]
+
+    return float(package_time), float(access_time)
+
+def benchmark_node_creation(node_count, use_cache):
+    """Time the creation of ImportSetDress nodes.
+
+    Args:
+        node_count (int): Number of nodes to create.
+        use_cache (bool): Keep the parm template group cache between nodes.
+
+    Returns:
+        float: Average creation time in seconds.
+    """
+    obj = hou.node("/obj")
+    total_time = 0.0
+
+    for _ in range(node_count):
+        if(not use_cache): ImportSetDress.parm_template_groups.clear()
+
+        start = time.perf_counter()
+        obj.createNode(node_type_name)
+        total_time += time.perf_counter() - start
+
+    return total_time / node_count
+
+if __name__ == "__main__":
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    package_time, access_time = benchmark_import()
+    print("Package import:      %.2f ms" % (package_time * 1000))
+    print("ImportSetDress load: %.2f ms" % (access_time * 1000))
+
+    # Warm up the HDA library and the python module outside of the measures.
+    hou.node("/obj").createNode(node_type_name).destroy()
+
+    baseline_time = benchmark_node_creation(node_count, use_cache=False)
+    hou.hipFile.clear(suppress_save_prompt=True)
+    cached_time = benchmark_node_creation(node_count, use_cache=True)
+
+    print("Node creation, baseline (avg over %i nodes): %.2f ms" % (node_count, baseline_time * 1000))
+    print("Node creation, cached   (avg over %i nodes): %.2f ms" % (node_count, cached_time * 1000))
@@ -1,5 +1,26 @@
-from .importSetDress import ImportSetDress
-from .loadAsset import LoadAsset
+import importlib
+
+# Classes are loaded on first access to keep the package import cheap.
+_lazy_classes = {
+    "ImportSetDress"    : ".importSetDress",
+    "LoadAsset"         : ".loadAsset",
+    "AssetTable"        : ".assetTable",
+    "AssetRecord"       : ".assetTable",
+}
+
+__all__ = list(_lazy_classes)
+
+def __getattr__(name):
+    if(name not in _lazy_classes):
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    value = getattr(importlib.import_module(_lazy_classes[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 """
 import sys
@@ -0,0 +1,145 @@
+import sys
+
+class AssetRecord:
+    """ Lightweight view on a single row of the asset table.
+    """
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index) -> None:
+        self.table = table
+        self.index = index
+
+    @property
+    def name(self):
+        return self.table.names[self.index]
+
+    @property
+    def instance(self):
+        return self.table.instances[self.index]
+
+    @property
+    def asset_type(self):
+        return self.table.types[self.index]
+
+    @property
+    def step(self):
+        return self.table.steps[self.index]
+
+    @property
+    def version(self):
+        return self.table.versions[self.index]
+
+    @property
+    def path(self):
+        return self.table.paths[self.index]
+
+    @property
+    def node_name(self):
+        return "%s_%s" % (self.name, self.instance)
+
+class AssetTable:
+    """ In-memory table of the set dress assets.
+
+    Every column is stored as a flat list, strings are interned so that
+    thousands of instances of the same asset share the same objects.
+    """
+    def __init__(self) -> None:
+        self.names      = []
+        self.instances  = []
+        self.types      = []
+        self.steps      = []
+        self.versions   = []
+        self.paths      = []
+
+        # (type, name, step) -> list of row indices.
+        self.by_asset   = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        for index in range(len(self.names)):
+            yield AssetRecord(self, index)
+
+    def add(self, name, instance, asset_type, step):
+        """ Add an asset to the table.
+
+        Args:
+            name (str): Name of the asset.
+            instance (str): Instance number of the asset, as displayed in the UI.
+            asset_type (str): Type of the asset.
+            step (str): Publish step of the asset.
+
+        Returns:
+            int: Index of the new row.
+        """
+        name        = sys.intern(name)
+        instance    = sys.intern(instance)
+        asset_type  = sys.intern(asset_type)
+        step        = sys.intern(step)
+
+        index = len(self.names)
+
+        self.names.append(name)
+        self.instances.append(instance)
+        self.types.append(asset_type)
+        self.steps.append(step)
+        self.versions.append("")
+        self.paths.append("")
+
+        self.by_asset.setdefault((asset_type, name, step), []).append(index)
+
+        return index
+
+    def set_publish(self, asset_key, version, path):
+        """ Set the version and path of all the instances of an asset.
+
+        Args:
+            asset_key (tuple): (type, name, step) key of the asset.
+            version (str): Version of the asset.
+            path (str): Path to the published file.
+        """
+        version = sys.intern(version)
+        path    = sys.intern(path)
+
+        for index in self.by_asset[asset_key]:
+            self.versions[index]    = version
+            self.paths[index]       = path
+
+    def sync_to_parms(self, hou_node):
+        """ Write the table to the node parameters.
+        The row count must already be set on the `assets` parameter.
+
+        Args:
+            hou_node (`class` : hou.Node): the current hda node.
+        """
+        for index in range(len(self.names)):
+            hou_node.parm("assetType%i" % index).set(self.types[index])
+            hou_node.parm("assetName%i" % index).set(self.names[index])
+            hou_node.parm("assetInstance%i" % index).set(self.instances[index])
+            hou_node.parm("assetVersion%i" % index).set(self.versions[index])
+            hou_node.parm("assetPath%i" % index).set(self.paths[index])
+
+    @classmethod
+    def from_parms(cls, hou_node):
+        """ Build the table from the node parameters.
+
+        Args:
+            hou_node (`class` : hou.Node): the current hda node.
+
+        Returns:
+            AssetTable: The asset table.
+        """
+        table = cls()
+
+        for index in range(hou_node.parm("assets").eval()):
+            table.add(
+                hou_node.parm("assetName%i" % index).evalAsString(),
+                hou_node.parm("assetInstance%i" % index).evalAsString(),
+                hou_node.parm("assetType%i" % index).evalAsString(),
+                hou_node.parm("assetStep%i" % index).evalAsString()
+            )
+            table.versions[index]   = sys.intern(hou_node.parm("assetVersion%i" % index).evalAsString())
+            table.paths[index]      = sys.intern(hou_node.parm("assetPath%i" % index).evalAsString())
+
+        return table
@@ -3,6 +3,8 @@ import json
 
 import hou
 
+from .assetTable import AssetTable
+
 class ImportSetDress:
     asset_folder_template = "<drive>:/shows/<project>/assets/<assetType>/<asset>/publishs/<step>"
 
@@ -11,6 +13,9 @@ class ImportSetDress:
         "EXPORT_MTLX"
     ]
 
+    # Built parm template groups indexed by HDA definition version.
+    parm_template_groups = {}
+
     def __init__(self) -> None:
         pass
 
@@ -23,6 +28,12 @@ class ImportSetDress:
         # Unlock node
         hou_node.allowEditingOfContents()
 
+        # Reuse the interface already built for this definition.
+        definition_key = self.get_definition_key(hou_node)
+        if(definition_key in self.parm_template_groups):
+            hou_node.setParmTemplateGroup(self.parm_template_groups[definition_key])
+            return
+
         # Get the interface template group.
         ptg = hou_node.parmTemplateGroup()
 
@@ -133,6 +144,25 @@ class ImportSetDress:
 
         # Update the node interface.
         hou_node.setParmTemplateGroup(ptg)
+        self.parm_template_groups[definition_key] = ptg
+
+    def get_definition_key(self, hou_node):
+        """ Get the key identifying the HDA definition version of the node.
+
+        Args:
+            hou_node (`class` : hou.Node): the current hda node.
+
+        Returns:
+            tuple: The type name, definition version and modification time.
+        """
+        definition = hou_node.type().definition()
+        if(definition is None): return (hou_node.type().name(), None, None)
+
+        return (
+            hou_node.type().name(),
+            definition.version(),
+            definition.modificationTime()
+        )
 
     #########
     # UTILS #
@@ -180,24 +210,25 @@ class ImportSetDress:
             hou_node.parm('setDressingCachePath').evalAsString()
         )
 
-        # Find all the informations from the attributes and store them in the root node.
+        # Find all the informations from the attributes and store them in the asset table.
         setDressNode    = hou_node.node('IMPORT_SET_DRESS').node('OUT')
         setDressGeo     = setDressNode.geometry()
-        
-        points          = setDressGeo.points()
-        
-        hou_node.parm("assets").set(len(points))
-        
-        for point in setDressGeo.points():
-            pointID         = point.number()
-            assetName       = point.stringAttribValue('assetName')
-            assetInstance   = point.intAttribValue('assetInstance')
-            assetType       = point.stringAttribValue('assetType')
-            assetStep       = hou_node.parm("assetStep%i" % pointID).evalAsString()
-            
-            hou_node.parm("assetType%i" % pointID).set(assetType)
-            hou_node.parm("assetName%i" % pointID).set(assetName)
-            hou_node.parm("assetInstance%i" % pointID).set("%03d" % assetInstance)
+
+        names           = setDressGeo.pointStringAttribValues('assetName')
+        instances       = setDressGeo.pointIntAttribValues('assetInstance')
+        types           = setDressGeo.pointStringAttribValues('assetType')
+
+        hou_node.parm("assets").set(len(names))
+
+        table = AssetTable()
+
+        for pointID in range(len(names)):
+            assetStep = hou_node.parm("assetStep%i" % pointID).evalAsString()
+            table.add(names[pointID], "%03d" % instances[pointID], types[pointID], assetStep)
+
+        # Resolve the publish only once per unique asset.
+        for assetKey in table.by_asset:
+            assetType, assetName, assetStep = assetKey
 
             assetPublishPath = self.asset_folder_template.replace('<drive>', 'O')
             assetPublishPath = assetPublishPath.replace('<project>', 'IZES')
@@ -207,19 +238,19 @@ class ImportSetDress:
 
             versions    = self.get_asset_versions(assetPublishPath)
             lastVersion = self.get_last_version(versions)
-            
-            hou_node.parm("assetVersion%i" % pointID).set(lastVersion)
-            
+
             assetPublishPath = "%s/v%s/caches" % (assetPublishPath, lastVersion)
-            
+
             fileName = self.get_version_file(assetPublishPath)
-            
+
             if(fileName is not None):
                 assetPublishPath = "%s/%s" % (assetPublishPath, fileName)
-                
-            hou_node.parm("assetPath%i" % pointID).set(assetPublishPath)
-        
-        self.load_assets(hou_node)
+
+            table.set_publish(assetKey, lastVersion, assetPublishPath)
+
+        table.sync_to_parms(hou_node)
+
+        self.load_assets(hou_node, table)
         if(len(shaders_assignations)>0): self.update_materials(hou_node, shaders_assignations)
     
     def get_asset_versions(self, publishPath):
@@ -255,25 +286,32 @@ class ImportSetDress:
                 
         return None
     
-    def load_assets(self, hou_node):
-        """ Load all the assets from the UI.
+    def load_assets(self, hou_node, table=None):
+        """ Load all the assets from the asset table.
+
+        Args:
+            hou_node (`class` : hou.Node): the current hda node.
+            table (`class` : AssetTable, optional): the asset table, rebuilt from the UI if not given.
         """
-        for i in range(hou_node.parm('assets').eval()):
-            assetName       = hou_node.parm('assetName%i' % i).evalAsString()
-            assetInstance   = hou_node.parm('assetInstance%i' % i).evalAsString()
-            
-            assetPath       = hou_node.parm('assetPath%i' % i).evalAsString()
-            
-            nodeName        = "%s_%s" % (assetName, assetInstance)
-                    
-            if(hou_node.node(nodeName) is None):
-                assetNode   = hou_node.createNode('loadAsset', node_name=nodeName)
-                assetNode.parm("alembicFile").set(hou_node.parm('assetPath%i' % i))
-                assetNode.parm("setDressGeometry").set('../IMPORT_SET_DRESS/OUT')
-                assetNode.parm("assetInstance").set(hou_node.parm('assetInstance%i' % i))
-                assetNode.parm("viewportlod").set(hou_node.parm('assetDisplay%i' % i))
-                assetNode.parm("viewportlod2").set(hou_node.parm('assetDisplay%i' % i))
-                
+        if(table is None): table = AssetTable.from_parms(hou_node)
+
+        existingNodes   = set(child.name() for child in hou_node.children())
+
+        for asset in table:
+            i           = asset.index
+            nodeName    = asset.node_name
+
+            # Only create the missing assets.
+            if(nodeName in existingNodes): continue
+
+            assetNode   = hou_node.createNode('loadAsset', node_name=nodeName)
+            assetNode.parm("alembicFile").set(hou_node.parm('assetPath%i' % i))
+            assetNode.parm("setDressGeometry").set('../IMPORT_SET_DRESS/OUT')
+            assetNode.parm("assetInstance").set(hou_node.parm('assetInstance%i' % i))
+            assetNode.parm("viewportlod").set(hou_node.parm('assetDisplay%i' % i))
+            assetNode.parm("viewportlod2").set(hou_node.parm('assetDisplay%i' % i))
+            existingNodes.add(nodeName)
+
         hou_node.layoutChildren()
     
     def clear_assets(self, hou_node):
@@ -343,10 +381,11 @@ class ImportSetDress:
             hou_node (`class` : hou.Node): the current hda node.
             shaders_assignations (list): List of the assignations between objects and shaders.
         """
-        for assignation in shaders_assignations:
-            if(hou_node.node(assignation["obj"]) == None): continue
+        children = {child.name() : child for child in hou_node.children()}
 
-            target_obj = hou_node.node(assignation["obj"])
+        for assignation in shaders_assignations:
+            target_obj = children.get(assignation["obj"])
+            if(target_obj == None): continue
 
             for matID, matAssign in enumerate(assignation["materials"]):
                 if(matAssign["paths"] == "#"):